@@ -4,7 +4,6 @@ from itertools import groupby
 import icalendar
 
 from schedule.bootcamp.config import bootcamp_config as config
-from schedule.bootcamp.models import BootcampEvent
 from schedule.bootcamp.parser import BootcampParser
 from schedule.utils import get_base_calendar
 
@@ -26,9 +25,9 @@ if __name__ == "__main__":
         group_calendar = get_base_calendar()
         group_calendar["x-wr-calname"] = f"Bootcamp 2023 {group_name}"
 
-        for group_event in group_events:
-            group_event: BootcampEvent
-            group_calendar.add_component(group_event.get_vevent())
+        group_calendar.subcomponents.extend(
+            group_event.get_vevent() for group_event in group_events
+        )
         group_slug = group_name.lower().replace(" ", "")
         file_name = f"{group_slug}.ics"
         file_path = year_path / file_name
@@ -45,4 +44,4 @@ if __name__ == "__main__":
             f.write(group_calendar.to_ical())
         # create a new .json file with information about calendars
     with open(json_file, "w") as f:
-        json.dump(json_data, f, indent=4, sort_keys=True)
+        f.write(json.dumps(json_data, indent=4, sort_keys=True))
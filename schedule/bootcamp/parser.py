@@ -26,8 +26,9 @@ class BootcampParser:
 
     def get_events(self):
         events = []
-        for (start_time, end_time), event_cells in self.df.iterrows():
-            for date, value in event_cells.items():
+        dates = self.df.columns
+        for (start_time, end_time), *event_cells in self.df.itertuples(name=None):
+            for date, value in zip(dates, event_cells):
                 cell_events = BootcampParser.process_event_cell(value)
                 for event in cell_events:
                     event.set_datetime(start_time, end_time, date)
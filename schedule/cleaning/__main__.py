@@ -41,13 +41,7 @@ if __name__ == "__main__":
         calendar = get_base_calendar()
 
         calendar["x-wr-calname"] = f"Cleaning: {location}"
-        vevents = []
-
-        for event in events:
-            vevents.append(event.get_vevent())
-
-        for vevent in vevents:
-            calendar.add_component(vevent)
+        calendar.subcomponents.extend(event.get_vevent() for event in events)
 
         group_alias = f"cleaning-{sluggify(location)}"
         filename = f"{group_alias}.ics"
@@ -62,7 +56,7 @@ if __name__ == "__main__":
                 path=file_path.relative_to(config.MOUNT_POINT).as_posix(),
             )
         )
-        logging.info(f"Saving {file_path}")
+        logging.info("Saving %s", file_path)
         with open(file_path, "wb") as f:
             f.write(calendar.to_ical())
 
@@ -84,13 +78,7 @@ if __name__ == "__main__":
         calendar = get_base_calendar()
         calendar["x-wr-calname"] = f"Linen Change: {location}"
 
-        vevents = []
-
-        for event in events:
-            vevents.append(event.get_vevent())
-
-        for vevent in vevents:
-            calendar.add_component(vevent)
+        calendar.subcomponents.extend(event.get_vevent() for event in events)
 
         group_alias = f"linen-change-{sluggify(location)}"
         filename = f"{group_alias}.ics"
@@ -108,7 +96,7 @@ if __name__ == "__main__":
                 path=file_path.relative_to(config.MOUNT_POINT).as_posix(),
             )
         )
-        logging.info(f"Saving {file_path}")
+        logging.info("Saving %s", file_path)
         with open(file_path, "wb") as f:
             f.write(calendar.to_ical())
 
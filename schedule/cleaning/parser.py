@@ -27,7 +27,7 @@ class CleaningParser:
         events = []
 
         for cleaning_entry in self.config.CLEANING_ENTRIES:
-            self.logger.info(f"Processing {cleaning_entry.name}")
+            self.logger.info("Processing %s", cleaning_entry.name)
             events.append(
                 CleaningEvent(
                     summary=cleaning_entry.name,
@@ -50,7 +50,7 @@ class CleaningParser:
         events = []
 
         for linen_change_entry in self.config.LINEN_CHANGE_ENTRIES:
-            self.logger.info(f"Processing {linen_change_entry.name}")
+            self.logger.info("Processing %s", linen_change_entry.name)
             events.append(
                 LinenChangeEvent(
                     summary=linen_change_entry.name,
@@ -1,8 +1,7 @@
 import asyncio
-import json
 import logging
 from hashlib import sha1
-from itertools import chain, groupby
+from itertools import groupby
 
 import pandas as pd
 from openpyxl.utils import column_index_from_string
@@ -72,22 +71,19 @@ if __name__ == "__main__":
             # -------- Set course and group as header; weekday and timeslot as index --------
             parser.set_course_and_group_as_header(course_df)
             parser.set_weekday_and_time_as_index(course_df)
-            # -------- Process cells and generate events --------
-            event_generators = (
-                course_df
-                # -------- Group by weekday and time --------
-                .groupby(level=[0, 1], sort=False).agg(list)
+            # -------- Group by weekday and time --------
+            by_columns = parser.group_cells_by_timeslot(course_df)
+            for column, cells in by_columns:
                 # -------- Apply CoreCourseCell to each cell --------
-                .map(
-                    lambda x: None
-                    if all(pd.isna(y) for y in x)
-                    else CoreCourseCell(value=x)
-                )
+                processed_cells = {
+                    key: CoreCourseCell(value=value) for key, value in cells.items()
+                }
                 # -------- Generate events from processed cells --------
-                .apply(parser.generate_events_from_processed_column, target=target)
-            )
-            # -------- Append generated events to events list --------
-            events.extend(chain.from_iterable(event_generators))
+                events.extend(
+                    parser.generate_events_from_processed_column(
+                        column, processed_cells, target=target
+                    )
+                )
 
     predefined_event_groups: list[CreateEventGroup] = []
 
@@ -122,17 +118,15 @@ if __name__ == "__main__":
 
         group_calendar["x-wr-calname"] = group
         group_events = list(group_events)
-        cnt = 0
+        group_vevents = []
         for group_event in group_events:
             if group_event.subject in config.IGNORED_SUBJECTS:
-                logging.info(f"> Ignoring {group_event.subject}")
+                logging.debug("> Ignoring %s", group_event.subject)
                 continue
             group_event: CoreCourseEvent
-            group_vevents = group_event.generate_vevents()
-            for vevent in group_vevents:
-                cnt += 1
-                group_calendar.add_component(vevent)
-        group_calendar.add("x-wr-total-vevents", str(cnt))
+            group_vevents.extend(group_event.generate_vevents())
+        group_calendar.subcomponents.extend(group_vevents)
+        group_calendar.add("x-wr-total-vevents", str(len(group_vevents)))
 
         group_slug = sluggify(group)
         group_alias = f"{semester_tag.alias}-{group_slug}"
@@ -141,7 +135,7 @@ if __name__ == "__main__":
         file_name = f"{group_slug}.ics"
         file_path = course_path / file_name
 
-        logging.info(f"> Writing {file_path.relative_to(config.MOUNT_POINT)}")
+        logging.info("> Writing %s", file_path.relative_to(config.MOUNT_POINT))
 
         with open(file_path, "wb") as f:
             content = group_calendar.to_ical()
@@ -168,7 +162,7 @@ if __name__ == "__main__":
     output = Output(event_groups=predefined_event_groups, tags=tags)
     # create a new .json file with information about calendar
     with open(config.SAVE_JSON_PATH, "w") as f:
-        json.dump(output.dict(), f, indent=2, sort_keys=False)
+        f.write(output.json(indent=2, sort_keys=False))
 
     # InNoHassle integration
     if config.INNOHASSLE_API_URL is None or config.PARSER_AUTH_KEY is None:
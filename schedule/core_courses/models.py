@@ -12,6 +12,24 @@ from schedule.core_courses.config import core_courses_config as config
 from schedule.processors.regex import process_spaces
 from schedule.utils import *
 
+GROUP_SIZE_PATTERN = re.compile(r"\s*\(\d+\)\s*$")
+BRACKETS_PATTERN = re.compile(r"\((.+?)\)")
+COLON_PATTERN = re.compile(r"\s*\:\s*")
+TEACHERS_SEPARATOR_PATTERN = re.compile(r"\s*[,/]\s*")
+REPEATING_COMMAS_PATTERN = re.compile(r"(\,\s*)+\,")
+TRAILING_COMMA_PATTERN = re.compile(r"\s*\,\s*$")
+ONLINE_PATTERN = re.compile(r"ONLINE", flags=re.IGNORECASE)
+AND_PATTERN = re.compile(r"\s+and\s+", flags=re.IGNORECASE)
+SLASH_PATTERN = re.compile(r"\s*\/\s*")
+WEEK_ONLY_PATTERN = re.compile(r"\(?WEEK ([^)]+) ONLY\)?", flags=re.IGNORECASE)
+STARTS_AT_PATTERN = re.compile(r"\(?STARTS AT ([^)]+)\)?", flags=re.IGNORECASE)
+STARTS_ON_PATTERN = re.compile(
+    r"\(?STARTS (?:ON|FROM) ([^)]+)\)?", flags=re.IGNORECASE
+)
+ONLY_ON_PATTERN = re.compile(r"\(?ONLY ON ([^)]+)\)?", flags=re.IGNORECASE)
+DATE_PATTERN = re.compile(r"\d{1,2}/\d{1,2}")
+CLASS_TYPES = ("lec", "tut", "lab")
+
 
 class CoreCourseCell:
     """Notes for the event"""
@@ -40,6 +58,8 @@ class CoreCourseCell:
         """
         Get event from cell
 
+        :param course: course name, already processed by preprocess_course
+        :param group: group name, already processed by preprocess_group
         :return: event from cell
         :rtype: Optional[CoreCourseCell]
         """
@@ -55,8 +75,8 @@ class CoreCourseCell:
                 starts=target.start_date,
                 ends=target.end_date,
                 weekday=weekday_int,
-                course=self.preprocess_course(course),
-                group=self.preprocess_group(group),
+                course=course,
+                group=group,
                 original_value=self.value,
                 **cell_info,
             )
@@ -93,7 +113,7 @@ class CoreCourseCell:
         - "B20-SD-02 (29)" -> "B20-SD-02"
         """
 
-        return re.sub(r"\s*\(\d+\)\s*$", "", value)
+        return GROUP_SIZE_PATTERN.sub("", value)
 
     def parse_value_into_parts(self) -> dict[str, ...]:
         """
@@ -184,20 +204,25 @@ class CoreCourseEvent(BaseModel):
         """
 
         subject = self.subject
-        matches = re.finditer(r"\((.+?)\)", subject)
-        for match in matches:
-            inside_brackets = match.group(1)
-
-            if re.match(r"^(?:lec|tut|lab)$", inside_brackets, flags=re.IGNORECASE):
-                # if inside_brackets is "lec" or "tut" or "lab" then it is class type
-                subject = subject.replace(match[0], "", 1)
-                self.class_type = inside_brackets.lower()  # type: ignore
-            else:
-                # if inside_brackets is not "lec" or "tut" or "lab" then it is part of subject
-                subject = subject.replace(match[0], f": {inside_brackets.strip()}", 1)
+        # most subjects have no brackets at all, so skip the regex scan for them
+        if "(" in subject:
+            matches = BRACKETS_PATTERN.finditer(subject)
+            for match in matches:
+                inside_brackets = match.group(1)
+
+                if inside_brackets.lower() in CLASS_TYPES:
+                    # if inside_brackets is "lec" or "tut" or "lab" then it is class type
+                    subject = subject.replace(match[0], "", 1)
+                    self.class_type = inside_brackets.lower()  # type: ignore
+                else:
+                    # if inside_brackets is not "lec" or "tut" or "lab" then it is part of subject
+                    subject = subject.replace(
+                        match[0], f": {inside_brackets.strip()}", 1
+                    )
 
         # remove whitespaces before colons(:)
-        subject = re.sub(r"\s*\:\s*", ": ", subject)
+        if ":" in subject:
+            subject = COLON_PATTERN.sub(": ", subject)
         subject = process_spaces(subject)
         self.subject = subject
 
@@ -215,11 +240,11 @@ class CoreCourseEvent(BaseModel):
 
         teacher = self.teacher
         # remove spaces before and after commas(,) and slashes(/) and replace them with comma(,)
-        teacher = re.sub(r"\s*[,/]\s*", ",", teacher)
+        teacher = TEACHERS_SEPARATOR_PATTERN.sub(",", teacher)
         # remove multiple commas in a row
-        teacher = re.sub(r"(\,\s*)+\,", ",", teacher)
+        teacher = REPEATING_COMMAS_PATTERN.sub(",", teacher)
         # remove trailing commas
-        teacher = re.sub(r"\s*\,\s*$", "", teacher)
+        teacher = TRAILING_COMMA_PATTERN.sub("", teacher)
         # remove trailing spaces
         teacher = teacher.strip()
         self.teacher = teacher
@@ -241,11 +266,10 @@ class CoreCourseEvent(BaseModel):
 
         location = self.location
         # sub "ONLINE", "online", with "ONLINE"
-        location = re.sub(
-            r"ONLINE", "ONLINE", location, flags=re.IGNORECASE
-        )
+        if "ONLINE" in location.upper():
+            location = ONLINE_PATTERN.sub("ONLINE", location)
         # replace " and " with comma
-        location = re.sub(r"\s+and\s+", ", ", location, flags=re.IGNORECASE)
+        location = AND_PATTERN.sub(", ", location)
         # patterns for "only on" information
         location = self.process_only_on(location)
         # patterns for "starts on" information
@@ -255,7 +279,8 @@ class CoreCourseEvent(BaseModel):
         # patterns for "week only" information
         location = self.process_week_only(location)
         # remove spaces near slashes(/)
-        location = re.sub(r"\s*\/\s*", "/", location)
+        if "/" in location:
+            location = SLASH_PATTERN.sub("/", location)
 
         self.location = location
 
@@ -265,9 +290,10 @@ class CoreCourseEvent(BaseModel):
         - "105 (WEEK 2-3 ONLY)" -> "105", only on weeks 2 and 3 of semester
         - "105 (WEEK 2 ONLY)" -> "105", only on week 2 of semester
         """
-        if week_only_m := re.search(
-            r"\(?WEEK ([^)]+) ONLY\)?", location, flags=re.IGNORECASE
-        ):
+        if "WEEK" not in location.upper():
+            return location
+
+        if week_only_m := WEEK_ONLY_PATTERN.search(location):
             week_only = week_only_m.group(1)
             location = location.replace(week_only_m.group(0), "", 1)
             if "-" in week_only:
@@ -292,9 +318,10 @@ class CoreCourseEvent(BaseModel):
         - "STARST AT 16.10" -> starts at 16.10
         - "107 (STARTS AT 10.50)" -> "107", starts at 10.50
         """
-        if starts_at_m := re.search(
-            r"\(?STARTS AT ([^)]+)\)?", location, flags=re.IGNORECASE
-        ):
+        if "STARTS AT" not in location.upper():
+            return location
+
+        if starts_at_m := STARTS_AT_PATTERN.search(location):
             starts_at = starts_at_m.group(1).replace(".", ":")
             location = location.replace(starts_at_m.group(0), "", 1)
             hour_and_minute = datetime.datetime.strptime(starts_at, "%H:%M").time()
@@ -308,9 +335,10 @@ class CoreCourseEvent(BaseModel):
         - "STARTS ON 2/10" -> starts on 2/10
         - "STARTS FROM 21/09" -> starts on 21/09
         """
-        if starts_on_m := re.search(
-            r"\(?STARTS (?:ON|FROM) ([^)]+)\)?", location, flags=re.IGNORECASE
-        ):
+        if "STARTS" not in location.upper():
+            return location
+
+        if starts_on_m := STARTS_ON_PATTERN.search(location):
             starts_on = starts_on_m.group(1)
             location = location.replace(starts_on_m.group(0), "", 1)
             month_and_day = datetime.datetime.strptime(starts_on, "%d/%m").date()
@@ -325,13 +353,14 @@ class CoreCourseEvent(BaseModel):
         - "ONLINE (only on 31/08 and 14/09)" -> "ONLINE", only on 31/08, 14/09
         """
 
-        if only_on_m := re.search(
-            r"\(?ONLY ON ([^)]+)\)?", location, flags=re.IGNORECASE
-        ):
+        if "ONLY ON" not in location.upper():
+            return location
+
+        if only_on_m := ONLY_ON_PATTERN.search(location):
             only_on = only_on_m.group(1)
             location = location.replace(only_on_m.group(0), "", 1)
             month_and_day = []
-            for date_str in re.findall(r"\d{1,2}/\d{1,2}", only_on):
+            for date_str in DATE_PATTERN.findall(only_on):
                 date = datetime.datetime.strptime(date_str, "%d/%m").date()
                 month_and_day.append(date)
 
@@ -13,9 +13,9 @@ from schedule.core_courses.config import core_courses_config as config
 from schedule.core_courses.models import CoreCourseEvent, CoreCourseCell
 from schedule.processors.regex import prettify_string
 from schedule.utils import (
-    get_merged_ranges,
-    get_sheet_by_id,
+    get_merged_ranges_by_sheet_id,
     get_sheets,
+    parse_timeslot,
     split_range_to_xy,
 )
 
@@ -49,8 +49,23 @@ class CoreCoursesParser:
         :return: dataframes with merged cells and empty cells filled
         :rtype: dict[str, pd.DataFrame]
         """
-        # ------- Read xlsx file into dataframes -------
-        dfs = pd.read_excel(xlsx_file, engine="openpyxl", sheet_name=None, header=None)
+        # ------- Read only target sheets of xlsx file into dataframes -------
+        xlsx_file.seek(0)
+        xlsx_zipfile = ZipFile(xlsx_file)
+        sheets = get_sheets(xlsx_zipfile)
+        sheet_names = [
+            sheet_name
+            for sheet_name in sheets.values()
+            if any(sheet_name.strip().startswith(t.sheet_name) for t in targets)
+        ]
+        xlsx_file.seek(0)
+        dfs = pd.read_excel(
+            xlsx_file,
+            engine="openpyxl",
+            sheet_name=sheet_names,
+            header=None,
+            dtype=object,
+        )
         # ------- Clean up dataframes -------
         dfs = {key.strip(): value for key, value in dfs.items()}
 
@@ -62,13 +77,15 @@ class CoreCoursesParser:
                     df = value
                     break
             # -------- Fill merged cells with values --------
-            CoreCoursesParser.merge_cells(df, xlsx_file, target.sheet_name)
+            df = CoreCoursesParser.merge_cells(
+                df, xlsx_zipfile, sheets, target.sheet_name
+            )
             # -------- Select range --------
             df = CoreCoursesParser.select_range(df, target.range)
-            # -------- Fill empty cells --------
-            df = df.replace(r"^\s*$", np.nan, regex=True)
             # -------- Strip, translate and remove trailing spaces --------
             df = df.map(prettify_string)
+            # -------- Fill empty cells (whitespace-only cells are empty now) --------
+            df = df.replace("", np.nan)
             # -------- Update dataframe --------
             dfs[target.sheet_name] = df
 
@@ -96,32 +113,39 @@ class CoreCoursesParser:
         return io.BytesIO(response.content)
 
     @classmethod
-    def merge_cells(cls, df: pd.DataFrame, xlsx: io.BytesIO, target_sheet_name: str):
+    def merge_cells(
+        cls,
+        df: pd.DataFrame,
+        xlsx_zipfile: ZipFile,
+        sheets: dict[str, str],
+        target_sheet_name: str,
+    ) -> pd.DataFrame:
         """
         Merge cells in dataframe
 
         :param df: Dataframe to process
-        :param xlsx: xlsx file with data
+        :param xlsx_zipfile: xlsx file with data as ZipFile
+        :param sheets: dict of sheet_id: sheet_name of xlsx file
         :param target_sheet_name: sheet to process
+        :return: dataframe with merged cells filled by top left value
         """
-        xlsx.seek(0)
-        xlsx_zipfile = ZipFile(xlsx)
-        sheets = get_sheets(xlsx_zipfile)
         target_sheet_id = None
         for sheet_id, sheet_name in sheets.items():
             if target_sheet_name in sheet_name:
                 target_sheet_id = sheet_id
                 break
-        sheet = get_sheet_by_id(xlsx_zipfile, target_sheet_id)
-        merged_ranges = get_merged_ranges(sheet)
+        merged_ranges = get_merged_ranges_by_sheet_id(xlsx_zipfile, target_sheet_id)
 
         # ------- Merge cells -------
+        # fill the underlying array at once instead of assigning through df.iloc
+        values = df.to_numpy(dtype=object)
         for merged_range in merged_ranges:
             (start_row, start_col), (end_row, end_col) = split_range_to_xy(merged_range)
-            # get value from top left cell
-            value = df.iloc[start_row, start_col]
-            # fill merged cells with value
-            df.iloc[start_row : end_row + 1, start_col : end_col + 1] = value
+            # fill merged cells with value from top left cell
+            values[start_row : end_row + 1, start_col : end_col + 1] = values[
+                start_row, start_col
+            ]
+        return pd.DataFrame(values, index=df.index, columns=df.columns)
 
     @classmethod
     def select_range(cls, df: pd.DataFrame, target_range: str) -> pd.DataFrame:
@@ -163,17 +187,20 @@ class CoreCoursesParser:
         df_column.ffill(inplace=True)
 
         # ----- Process weekday ------ #
-        # get indexes of weekdays
-        weekdays_indexes = [
-            i for i, cell in enumerate(df_column.values) if cell in config.WEEKDAYS
-        ]
+        # find rows with weekdays
+        is_weekday = df_column.isin(config.WEEKDAYS).to_numpy()
+        values = df_column.to_numpy()
+
+        # forward fill position of the last weekday row [-1, -1, 2, 2, 2, 5, ...]
+        weekday_positions = np.where(is_weekday, np.arange(len(values)), -1)
+        np.maximum.accumulate(weekday_positions, out=weekday_positions)
 
-        # create index mapping for weekdays [None, None, "MONDAY", "MONDAY", ...]
-        index_mapping = pd.Series(index=df_column.index, dtype=object)
-        last_index = len(df_column)
-        for start, end in pairwise(weekdays_indexes + [last_index]):
-            index_mapping.iloc[start] = "delete"
-            index_mapping.iloc[start + 1 : end] = df_column[start]
+        # create index mapping for weekdays [None, None, "delete", "MONDAY", ...]
+        index_mapping = np.where(
+            weekday_positions >= 0, values[weekday_positions], None
+        )
+        index_mapping[is_weekday] = "delete"
+        index_mapping = pd.Series(index_mapping, index=df_column.index, dtype=object)
 
         # ----- Process time ------ #
         # matched r"\d{1,2}:\d{2}-\d{1,2}:\d{2}" regex
@@ -182,11 +209,7 @@ class CoreCoursesParser:
 
         for i, cell in matched.items():
             # "9:00-10:30" -> datetime.time(9, 0), datetime.time(10, 30)
-            start, end = cell.split("-")
-            df_column.loc[i] = (
-                datetime.strptime(start, "%H:%M").time(),
-                datetime.strptime(end, "%H:%M").time(),
-            )
+            df_column.loc[i] = parse_timeslot(cell)
 
         # create multiindex from index mapping and time column
         multiindex = pd.MultiIndex.from_arrays(
@@ -242,7 +265,7 @@ class CoreCoursesParser:
         cls.logger.info("Get indexes of time columns...")
 
         time_columns_indexes = time_columns
-        cls.logger.info(f"Time columns indexes: {time_columns_indexes}")
+        cls.logger.info("Time columns indexes: %s", time_columns_indexes)
 
         # split dataframe by found columns
         _, max_y = df.shape
@@ -251,33 +274,72 @@ class CoreCoursesParser:
         split_dfs = []
 
         for i, (start, end) in enumerate(pairwise(split_indexes)):
-            cls.logger.info(f"Splitting dataframe by columns {start}:{end}")
+            cls.logger.info("Splitting dataframe by columns %d:%d", start, end)
             split_df = df.iloc[:, start:end].copy()
             split_dfs.append(split_df)
         return split_dfs
 
+    @classmethod
+    def group_cells_by_timeslot(
+        cls, df: pd.DataFrame
+    ) -> list[tuple[tuple[str, str], dict[tuple[str, tuple], list]]]:
+        """
+        Collect values of each column into lists by (weekday, timeslot) index.
+        Missing values are replaced by None and groups without any value are skipped.
+
+        :param df: dataframe with (weekday, timeslot) multiindex and (course, group) columns
+        :type df: pd.DataFrame
+        :return: list of (course, group) and dict of (weekday, timeslot) to cell values
+        :rtype: list[tuple[tuple[str, str], dict[tuple[str, tuple], list]]]
+        """
+        # detect missing values for the whole dataframe at once
+        values = df.to_numpy(dtype=object)
+        values[df.isna().to_numpy()] = None
+
+        by_columns = [{} for _ in df.columns]
+
+        for (weekday, timeslot), row in zip(df.index, values):
+            # skip rows without weekday or timeslot (as groupby does for nan keys)
+            if pd.isna(weekday) or (
+                not isinstance(timeslot, tuple) and pd.isna(timeslot)
+            ):
+                continue
+            for cells, value in zip(by_columns, row):
+                cells.setdefault((weekday, timeslot), []).append(value)
+
+        return [
+            (
+                column,
+                {
+                    key: value
+                    for key, value in cells.items()
+                    if any(x is not None for x in value)
+                },
+            )
+            for column, cells in zip(df.columns, by_columns)
+        ]
+
     @classmethod
     def generate_events_from_processed_column(
         cls,
-        processed_column: pd.Series,
+        column: tuple[str, str],
+        processed_cells: dict[tuple[str, tuple], CoreCourseCell],
         target: config.Target,
     ) -> Generator[CoreCourseEvent, None, None]:
         """
         Generate events from processed cells
 
+        :param column: (course, group) of the column
+        :param processed_cells: processed cells (CoreCourseCell) by (weekday, timeslot)
         :param target: target to generate events for (needed for start and end dates)
-        :param processed_column: series with processed cells (CoreCourseCell),
-         multiindex with (weekday, timeslot) and (course, group) as name
         :return: generator of events
         """
         # -------- Iterate over processed cells --------
-        (course, group) = processed_column.name
-        course: str
-        group: str
+        (course, group) = column
+        course: str = CoreCourseCell.preprocess_course(course)
+        group: str = CoreCourseCell.preprocess_group(group)
 
-        for (weekday, timeslot), cell in processed_column.items():
-            if cell is None:
-                continue
+        for (weekday, timeslot), cell in processed_cells.items():
             cell: CoreCourseCell
             weekday: str
             timeslot: tuple[datetime.time, datetime.time]
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 from hashlib import sha1
 
@@ -97,13 +96,8 @@ if __name__ == "__main__":
             calendar = get_base_calendar()
             calendar["x-wr-calname"] = calendar_name
 
-            cnt = 0
-
-            for event in events:
-                calendar.add_component(event.get_vevent())
-                cnt += 1
-
-            calendar.add("x-wr-total-vevents", str(cnt))
+            calendar.subcomponents.extend(event.get_vevent() for event in events)
+            calendar.add("x-wr-total-vevents", str(len(events)))
 
             elective_x_group_alias = sluggify(calendar_name)
             calendar_alias = f"{config.SEMESTER_TAG.alias}-{sluggify(target.sheet_name)}-{elective_x_group_alias}"
@@ -111,7 +105,7 @@ if __name__ == "__main__":
             file_name = f"{elective_x_group_alias}.ics"
             file_path = elective_type_directory / file_name
 
-            logging.info(f"> Writing {file_path.relative_to(config.MOUNT_POINT)}")
+            logging.info("> Writing %s", file_path.relative_to(config.MOUNT_POINT))
 
             with open(file_path, "wb") as f:
                 content = calendar.to_ical()
@@ -142,7 +136,7 @@ if __name__ == "__main__":
     output = Output(event_groups=predefined_event_groups, tags=tags)
     # create a new .json file with information about calendar
     with open(config.SAVE_JSON_PATH, "w") as f:
-        json.dump(output.dict(), f, indent=2, sort_keys=False)
+        f.write(output.json(indent=2, sort_keys=False))
 
     # InNoHassle integration
     if config.INNOHASSLE_API_URL is None or config.PARSER_AUTH_KEY is None:
@@ -54,3 +54,8 @@ with open(CONFIG_PATH, "r") as f:
 electives_config: ElectivesParserConfig = parse_obj_as(
     ElectivesParserConfig, elective_config_dict
 )
+
+# electives indexed by alias, reversed so that the first one wins on duplicates
+electives_by_alias: dict[str, Elective] = {
+    elective.alias: elective for elective in reversed(electives_config.ELECTIVES)
+}
@@ -1,5 +1,6 @@
 import datetime
 import re
+from dataclasses import dataclass, field
 from typing import Optional, Any, Generator
 from zlib import crc32
 
@@ -9,6 +10,11 @@ from pydantic import BaseModel, validator, Field
 from schedule.config_base import CSS3Color
 from schedule.processors.regex import symbol_translation, process_spaces
 
+TIMESLOT_PATTERN = re.compile(r"\(?(\d{2}:\d{2})-(\d{2}:\d{2})\)?")
+STARTS_AT_PATTERN = re.compile(r"\(?starts at (\d{2}:\d{2})\)?")
+CLASS_TYPE_PATTERN = re.compile(r"\(?(lab|lec)\)?", flags=re.IGNORECASE)
+GROUP_PATTERN = re.compile(r"\(?(Group \d+)\)?")
+
 
 class Elective(BaseModel):
     """
@@ -88,7 +94,7 @@ class ElectiveCell(BaseModel):
             - ASEM (starts at 18:05) 101
             """
 
-            from schedule.electives.config import electives_config as config
+            from schedule.electives.config import electives_by_alias
 
             super().__init__(**data)
 
@@ -97,15 +103,11 @@ class ElectiveCell(BaseModel):
             # just first word as elective
             splitter = string.split(" ")
             elective_alias = splitter[0]
-            self.elective = next(
-                elective
-                for elective in config.ELECTIVES
-                if elective.alias == elective_alias
-            )
+            self.elective = electives_by_alias[elective_alias]
             string = " ".join(splitter[1:])
             # find time xx:xx-xx:xx
 
-            if timeslot_m := re.search(r"\(?(\d{2}:\d{2})-(\d{2}:\d{2})\)?", string):
+            if timeslot_m := TIMESLOT_PATTERN.search(string):
                 self.starts_at = datetime.datetime.strptime(
                     timeslot_m.group(1), "%H:%M"
                 ).time()
@@ -115,21 +117,19 @@ class ElectiveCell(BaseModel):
                 string = string.replace(timeslot_m.group(0), "")
 
             # find starts at xx:xx
-            if timeslot_m := re.search(r"\(?starts at (\d{2}:\d{2})\)?", string):
+            if timeslot_m := STARTS_AT_PATTERN.search(string):
                 self.starts_at = datetime.datetime.strptime(
                     timeslot_m.group(1), "%H:%M"
                 ).time()
                 string = string.replace(timeslot_m.group(0), "")
 
             # find (lab), (lec)
-            if class_type_m := re.search(
-                r"\(?(lab|lec)\)?", string, flags=re.IGNORECASE
-            ):
+            if class_type_m := CLASS_TYPE_PATTERN.search(string):
                 self.class_type = class_type_m.group(1).lower()
                 string = string.replace(class_type_m.group(0), "")
 
             # find (Group 1)
-            if group_m := re.search(r"\(?(Group \d+)\)?", string):
+            if group_m := GROUP_PATTERN.search(string):
                 self.group = group_m.group(1)
                 string = string.replace(group_m.group(0), "")
 
@@ -181,9 +181,11 @@ class ElectiveCell(BaseModel):
             )
 
 
-class ElectiveEvent(BaseModel):
+@dataclass(slots=True)
+class ElectiveEvent:
     """
-    Elective event model
+    Elective event model (plain dataclass as it is created for every occurrence
+    from already validated values)
     """
 
     elective: Elective
@@ -192,14 +194,19 @@ class ElectiveEvent(BaseModel):
     """ Event start time """
     end: datetime.datetime
     """ Event end time """
-    location: Optional[str]
+    location: Optional[str] = None
     """ Event location """
-    class_type: Optional[str]
+    class_type: Optional[str] = None
     """ Event type """
     group: Optional[str] = None
     """ Group to which the event belongs """
+    _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    """ Cached hash, events are not modified after creation """
 
     def __hash__(self):
+        if self._hash is not None:
+            return self._hash
+
         string_to_hash = str(
             (
                 self.elective.alias,
@@ -211,7 +218,8 @@ class ElectiveEvent(BaseModel):
             )
         )
 
-        return crc32(string_to_hash.encode("utf-8"))
+        self._hash = crc32(string_to_hash.encode("utf-8"))
+        return self._hash
 
     def get_uid(self: "ElectiveEvent") -> str:
         """
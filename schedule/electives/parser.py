@@ -3,8 +3,9 @@ import logging
 import re
 from collections import defaultdict
 from datetime import datetime
-from itertools import pairwise, groupby
+from itertools import groupby
 from typing import Generator
+from zipfile import ZipFile
 
 import numpy as np
 import pandas as pd
@@ -18,6 +19,8 @@ from schedule.processors.regex import prettify_string
 from schedule.utils import *
 
 BRACKETS_PATTERN = re.compile(r"\((.*?)\)")
+TIMESLOT_PATTERN = re.compile(r"\d{1,2}:\d{2}-\d{1,2}:\d{2}")
+DATE_PATTERN = re.compile(r"\w+ \d+")
 
 
 class ElectiveParser:
@@ -46,8 +49,21 @@ class ElectiveParser:
         :return: dataframes with merged cells and empty cells filled
         :rtype: dict[str, pd.DataFrame]
         """
-        # ------- Read xlsx file into dataframes -------
-        dfs = pd.read_excel(xlsx_file, engine="openpyxl", sheet_name=None, header=None)
+        # ------- Read only target sheets of xlsx file into dataframes -------
+        xlsx_file.seek(0)
+        sheet_names = [
+            sheet_name
+            for sheet_name in get_sheets(ZipFile(xlsx_file)).values()
+            if any(sheet_name.strip().startswith(t.sheet_name) for t in targets)
+        ]
+        xlsx_file.seek(0)
+        dfs = pd.read_excel(
+            xlsx_file,
+            engine="openpyxl",
+            sheet_name=sheet_names,
+            header=None,
+            dtype=object,
+        )
         # ------- Clean up dataframes -------
         dfs = {key.strip(): value for key, value in dfs.items()}
 
@@ -60,8 +76,8 @@ class ElectiveParser:
             df = ElectiveParser.set_time_column_as_index(df)
             # -------- Strip all values --------
             df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
-            # -------- Fill empty cells --------
-            df = df.replace(r"^\s*$", np.nan, regex=True)
+            # -------- Fill empty cells (whitespace-only cells are empty now) --------
+            df = df.replace("", np.nan)
             # -------- Exclude nan rows --------
             df = df.dropna(how="all")
             # -------- Strip, translate and remove trailing spaces --------
@@ -162,12 +178,8 @@ class ElectiveParser:
         :rtype: tuple[datetime.time, datetime.time]
         """
         # "9:00-10:30" -> datetime.time(9, 0), datetime.time(10, 30)
-        if re.match(r"\d{1,2}:\d{2}-\d{1,2}:\d{2}", cell):
-            start, end = cell.split("-")
-            return (
-                datetime.strptime(start, "%H:%M").time(),
-                datetime.strptime(end, "%H:%M").time(),
-            )
+        if TIMESLOT_PATTERN.match(cell):
+            return parse_timeslot(cell)
         else:
             return cell
 
@@ -182,7 +194,7 @@ class ElectiveParser:
         :rtype: datetime.date
         """
         # "June 7" -> datetime.date(current_year, 6, 7)
-        if re.match(r"\w+ \d+", cell):
+        if DATE_PATTERN.match(cell):
             cell = str(get_current_year()) + " " + cell
             dtime = datetime.strptime(cell, "%Y %B %d")
             return dtime.date()
@@ -204,17 +216,18 @@ class ElectiveParser:
         cls.logger.info("Get 'week' indexes...")
         # find indexes of row with "Week *"
         where = df.index.str.contains(r"Week \d", na=False)
-        week_indexes = df.index[where]
-        week_locations = df.index.get_indexer_for(week_indexes).tolist()
-        cls.logger.info(f"> Found {len(week_locations)} weeks")
+        week_locations = np.flatnonzero(where)
+        cls.logger.info("> Found %d weeks", len(week_locations))
 
         max_x, _ = df.shape
-        week_locations += [max_x]  # add last index
+        bounds = np.append(week_locations, max_x)  # add last index
         # split dataframe by week indexes
         dfs = []
-        for start, end in pairwise(week_locations):
+        for start, end in zip(bounds[:-1], bounds[1:]):
             week = df.index[start]
-            cls.logger.info(f"Processing week: {week}... From ({start}) to ({end})")
+            cls.logger.info(
+                "Processing week: %s... From (%d) to (%d)", week, start, end
+            )
             week_df: pd.DataFrame = df.iloc[start:end].copy()
             # ----- Set date row as header -----
             week_df = ElectiveParser.set_date_row_as_header(week_df)
@@ -6,6 +6,7 @@ __all__ = [
     "ViewEventGroup",
 ]
 
+import asyncio
 import logging
 import pathlib
 import re
@@ -14,6 +15,9 @@ from typing import Optional, Any
 import aiohttp
 from pydantic import BaseModel, Field, validator
 
+MAX_CONCURRENT_UPLOADS = 8
+"""Maximum number of ICS files uploaded to InNoHassle at the same time"""
+
 
 class CreateTag(BaseModel):
     alias: str
@@ -103,13 +107,14 @@ class InNoHassleEventsClient:
             ) as response:
                 if response.status == 200:
                     logging.info(
-                        f"ICS file for event group {event_group_id} is not modified"
+                        "ICS file for event group %s is not modified", event_group_id
                     )
                     return
 
                 if response.status == 201:
                     logging.info(
-                        f"ICS file for event group {event_group_id} updated successfully"
+                        "ICS file for event group %s updated successfully",
+                        event_group_id,
                     )
                     return
 
@@ -158,18 +163,24 @@ async def update_inh_event_groups(
     logging.info(f"Trying to create or read {len(output.event_groups)} event groups")
     inh_event_groups = await inh_client.batch_create_or_read_event_groups(output.event_groups)
     inh_event_groups_dict = {group.alias: group for group in inh_event_groups}
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
 
-    for event_group in output.event_groups:
+    async def update_event_group(event_group: CreateEventGroup) -> None:
         inh_event_group = inh_event_groups_dict.get(event_group.alias)
 
         if inh_event_group is None:
-            logging.warning(f"Event group {event_group.alias} not found")
+            logging.warning("Event group %s not found", event_group.alias)
         else:
-            logging.info(f"Updating event group {event_group.alias}")
-            await inh_client.update_ics(
-                event_group_id=inh_event_group.id,
-                ics_content=(mount_point / event_group.path).read_bytes(),
-            )
+            async with semaphore:
+                logging.info("Updating event group %s", event_group.alias)
+                await inh_client.update_ics(
+                    event_group_id=inh_event_group.id,
+                    ics_content=(mount_point / event_group.path).read_bytes(),
+                )
+
+    await asyncio.gather(
+        *(update_event_group(event_group) for event_group in output.event_groups)
+    )
 
 
 def validate_slug(s):
@@ -6,6 +6,21 @@ symbol_translation = str.maketrans(
     "ABEKMHOPCTYXacp",
 )
 
+NOT_SLUG_SYMBOLS_PATTERN = re.compile(r"[^a-z0-9\s-]")
+SPACES_PATTERN = re.compile(r"\s+")
+MULTIPLE_SPACES_PATTERN = re.compile(r"\s{2,}")
+MULTIPLE_DASHES_PATTERN = re.compile(r"-{2,}")
+REPEATING_OPENING_BRACKETS_PATTERN = re.compile(r"(\(\s*)+\(")
+REPEATING_CLOSING_BRACKETS_PATTERN = re.compile(r"(\)\s*)+\)")
+OPENING_BRACKET_PATTERN = re.compile(r"\s*\(\s*")
+CLOSING_BRACKET_PATTERN = re.compile(r"\s*\)\s*")
+REPEATING_COMMAS_PATTERN = re.compile(r"(\,\s*)+\,")
+COMMA_PATTERN = re.compile(r"\s*\,\s*")
+ONLY_ON_PATTERN = re.compile(r"\(ONLY ON (.+)\)", re.IGNORECASE)
+TRAILING_ONLY_ON_PATTERN = re.compile(r"\s+\(ONLY ON .+\)")
+PARENTHESES_PATTERN = re.compile(r"\((.+)\)")
+TRAILING_PARENTHESES_PATTERN = re.compile(r"\s+\(.+\)")
+
 
 def sluggify(s: str) -> str:
     """
@@ -19,10 +34,10 @@ def sluggify(s: str) -> str:
     s = s.lower()
     s = s.translate(symbol_translation)
     # also translates special symbols, brackets, commas, etc.
-    s = re.sub(r"[^a-z0-9\s-]", " ", s)
-    s = re.sub(r"\s+", "-", s)
+    s = NOT_SLUG_SYMBOLS_PATTERN.sub(" ", s)
+    s = SPACES_PATTERN.sub("-", s)
     # remove multiple dashes
-    s = re.sub(r"-{2,}", "-", s)
+    s = MULTIPLE_DASHES_PATTERN.sub("-", s)
 
     return s
 
@@ -31,7 +46,7 @@ def process_spaces(s: str) -> str:
     """
     Remove multiple spaces and trailing spaces.
     """
-    return re.sub(r"\s{2,}", " ", s).strip()
+    return MULTIPLE_SPACES_PATTERN.sub(" ", s).strip()
 
 
 def process_brackets(s: str) -> str:
@@ -44,12 +59,12 @@ def process_brackets(s: str) -> str:
     :rtype: str
     """
     # remove multiple brackets in a row
-    s = re.sub(r"(\(\s*)+\(", "(", s)
-    s = re.sub(r"(\)\s*)+\)", ")", s)
+    s = REPEATING_OPENING_BRACKETS_PATTERN.sub("(", s)
+    s = REPEATING_CLOSING_BRACKETS_PATTERN.sub(")", s)
 
     # set only one space after and before brackets except for brackets in the end of string
-    s = re.sub(r"\s*\(\s*", " (", s)
-    s = re.sub(r"\s*\)\s*", ") ", s)
+    s = OPENING_BRACKET_PATTERN.sub(" (", s)
+    s = CLOSING_BRACKET_PATTERN.sub(") ", s)
     s = s.strip()
     return s
 
@@ -64,9 +79,9 @@ def process_commas(s: str) -> str:
     :rtype: str
     """
     # remove multiple commas in a row
-    s = re.sub(r"(\,\s*)+\,", ",", s)
+    s = REPEATING_COMMAS_PATTERN.sub(",", s)
     # set only one space after and before commas except for commas in the end of string
-    s = re.sub(r"\s*\,\s*", ", ", s)
+    s = COMMA_PATTERN.sub(", ", s)
     s = s.strip()
     return s
 
@@ -105,14 +120,15 @@ def process_only_on(input_str: str) -> tuple[str, list[datetime.date]] | None:
     ("108", [datetime.date(month=6, day=14), datetime.date(month=6, day=18)])
     """
 
-    if match := re.search(r"\(ONLY ON (.+)\)", input_str, re.IGNORECASE):
+    if match := ONLY_ON_PATTERN.search(input_str):
         only_on_str = match.group(1)
-        only_on_str = re.sub(r"\s+", "", only_on_str)
+        # remove spaces
+        only_on_str = "".join(only_on_str.split())
         only_on = []
         for date_str in only_on_str.split(","):
             date = datetime.datetime.strptime(date_str, "%d/%m").date()
             only_on.append(date)
-        formatted_str = re.sub(r"\s+\(ONLY ON .+\)", "", input_str)
+        formatted_str = TRAILING_ONLY_ON_PATTERN.sub("", input_str)
         return formatted_str, only_on
 
 
@@ -123,9 +139,9 @@ def process_desc_in_parentheses(input_str: str) -> tuple[str, str] | None:
     :param input_str: string with parentheses description (e.g. "Software Project (lec)")
     :return: None if no parentheses description found, tuple of formatted string and description otherwise
     """
-    if match := re.search(r"\((.+)\)", input_str):
+    if match := PARENTHESES_PATTERN.search(input_str):
         parentheses_desc = match.group(1)
         # remove spaces
-        parentheses_desc = re.sub(r"\s+", "", parentheses_desc)
-        formatted_str = re.sub(r"\s+\(.+\)", "", input_str)
+        parentheses_desc = "".join(parentheses_desc.split())
+        formatted_str = TRAILING_PARENTHESES_PATTERN.sub("", input_str)
         return formatted_str, parentheses_desc
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 from itertools import groupby
 
@@ -52,12 +51,12 @@ async def main():
         calendar = get_base_calendar()
 
         calendar_name = f"{title} - {subtitle}" if subtitle else title
-        logging.info(f"Saving {calendar_name} calendar")
+        logging.info("Saving %s calendar", calendar_name)
         calendar["x-wr-calname"] = calendar_name
-        for event in events:
-            event: SportScheduleEvent
-            vevent = event.get_vevent(config.START_OF_SEMESTER, config.END_OF_SEMESTER)
-            calendar.add_component(vevent)
+        calendar.subcomponents.extend(
+            event.get_vevent(config.START_OF_SEMESTER, config.END_OF_SEMESTER)
+            for event in events
+        )
 
         group_alias = sluggify(calendar_name)
 
@@ -80,7 +79,7 @@ async def main():
 
     logging.info(f"Saving calendars information to {json_file}")
     with open(json_file, "w") as f:
-        json.dump(output.dict(), f, indent=2, sort_keys=False)
+        f.write(output.json(indent=2, sort_keys=False))
 
     logging.info("Done")
 
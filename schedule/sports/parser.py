@@ -31,11 +31,11 @@ class SportParser:
         start = config.START_OF_SEMESTER.strftime("%Y-%m-%d")
         final = config.END_OF_SEMESTER.strftime("%Y-%m-%d")
         url = f"{config.api_url}/calendar/{sport_id}/schedule?start={start}T00%3A00&end={final}T00%3A00"
-        self.logger.info(f"Getting sport schedule from {url}")
+        self.logger.info("Getting sport schedule from %s", url)
         async with self.session.get(url) as response:
             text = await response.text()
             response_schema = ResponseSportSchedule.parse_raw(text)
-            self.logger.info(f"Got {len(response_schema.__root__)} events")
+            self.logger.info("Got %d events", len(response_schema.__root__))
             return response_schema
 
     async def batch_get_sport_schedule(
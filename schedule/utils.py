@@ -10,10 +10,13 @@ __all__ = [
     "get_sheet_by_id",
     "get_namespace",
     "get_merged_ranges",
+    "get_merged_ranges_by_sheet_id",
     "split_range_to_xy",
+    "parse_timeslot",
 ]
 
 import datetime
+import functools
 import os
 import re
 from pathlib import Path
@@ -234,6 +237,27 @@ def get_merged_ranges(xlsx_sheet: ET.Element) -> list[str]:
     return merged_ranges
 
 
+def get_merged_ranges_by_sheet_id(xlsx_zipfile: ZipFile, sheet_id: str) -> list[str]:
+    """
+    Stream xl/worksheets/sheet{sheet_id}.xml and return list of merged ranges
+    without building the whole sheet tree
+
+    :param xlsx_zipfile: .xlsx file as ZipFile
+    :param sheet_id: id of sheet to read
+    :return: list of merged ranges (e.g. ['A1:B2', 'C3:D4'])
+    """
+    merged_ranges = []
+    with xlsx_zipfile.open(f"xl/worksheets/sheet{str(sheet_id)}.xml") as f:
+        for _, element in ET.iterparse(f):
+            _, _, tag = element.tag.rpartition("}")
+            if tag == "mergeCell":
+                merged_ranges.append(element.attrib["ref"])
+            elif tag == "row":
+                # cells are not needed, free them as soon as the row is parsed
+                element.clear()
+    return merged_ranges
+
+
 def split_range_to_xy(target_range: str):
     """
     Split range to x, y coordinates starting from 0
@@ -247,3 +271,24 @@ def split_range_to_xy(target_range: str):
     end_row, end_col = coordinate_to_tuple(end)
     end_row, end_col = end_row - 1, end_col - 1
     return (start_row, start_col), (end_row, end_col)
+
+
+@functools.cache
+def parse_timeslot(timeslot: str) -> tuple[datetime.time, datetime.time]:
+    """
+    Parse timeslot into start and end time. Results are cached as the same
+    timeslots repeat all over the schedule.
+
+    :param timeslot: timeslot to parse e.g. "9:00-10:30"
+    :return: start and end time
+
+    >>> parse_timeslot("9:00-10:30")
+    (datetime.time(9, 0), datetime.time(10, 30))
+    """
+    start, end = timeslot.split("-")
+    start_hour, start_minute = start.split(":")
+    end_hour, end_minute = end.split(":")
+    return (
+        datetime.time(int(start_hour), int(start_minute)),
+        datetime.time(int(end_hour), int(end_minute)),
+    )
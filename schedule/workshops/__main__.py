@@ -74,4 +74,4 @@ if __name__ == "__main__":
             f.write(workshop_calendar.to_ical())
         # create a new .json file with information about calendars
     with open(json_file, "w") as f:
-        json.dump(calendars_data, f, indent=4, sort_keys=True)
+        f.write(json.dumps(calendars_data, indent=4, sort_keys=True))
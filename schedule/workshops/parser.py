@@ -28,8 +28,9 @@ class WorkshopParser:
 
     def get_events(self) -> list[WorkshopEvent]:
         events = []
-        for _, event_cells in self.df.iterrows():
-            for date, value in event_cells.items():
+        dates = self.df.columns
+        for event_cells in self.df.itertuples(index=False, name=None):
+            for date, value in zip(dates, event_cells):
                 cell_event = WorkshopParser.process_event_cell(value)
                 if cell_event is None:
                     continue